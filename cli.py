@@ -9,7 +9,50 @@ using various pixel manipulation techniques.
 import argparse
 import sys
 import os
-from image_encryptor import ImageEncryptor
+from types import MappingProxyType
+
+
+# Method-specific arguments forwarded to ImageEncryptor for each method
+_METHOD_KWARGS = MappingProxyType({
+    'xor': ('key',),
+    'arithmetic': ('operation', 'value'),
+    'bit_shift': ('shift_amount', 'direction'),
+    'adjacent_swap': (),
+    'random_swap': ('swap_percentage',),
+    'block_swap': ('block_size',),
+    'channel_shift': (),
+})
+
+
+def _bounded_int(low, high=None):
+    """Build an argparse type that parses an integer from low to high (no upper bound if high is None)"""
+    def parse(text):
+        try:
+            value = int(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid integer: {text!r}")
+        if value < low or (high is not None and value > high):
+            bounds = f"at least {low}" if high is None else f"between {low} and {high}"
+            raise argparse.ArgumentTypeError(f"must be {bounds}, got {value}")
+        return value
+    return parse
+
+
+_byte = _bounded_int(0, 255)
+# Shifting a byte by more than 8 bits gives the same result as 8
+_shift_amount = _bounded_int(0, 8)
+_positive_int = _bounded_int(1)
+
+
+def _fraction(text):
+    """Parse a number in the range 0.0-1.0"""
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {text!r}")
+    if not 0.0 <= value <= 1.0:
+        raise argparse.ArgumentTypeError(f"must be between 0.0 and 1.0, got {value}")
+    return value
 
 
 def main():
@@ -47,25 +90,22 @@ Examples:
     encrypt_parser = subparsers.add_parser('encrypt', help='Encrypt an image')
     encrypt_parser.add_argument('input', help='Path to input image')
     encrypt_parser.add_argument('output', help='Path to save encrypted image')
-    encrypt_parser.add_argument('--method', choices=[
-        'xor', 'arithmetic', 'bit_shift', 'adjacent_swap', 
-        'random_swap', 'block_swap', 'channel_shift'
-    ], default='xor', help='Encryption method (default: xor)')
+    encrypt_parser.add_argument('--method', choices=list(_METHOD_KWARGS), default='xor', help='Encryption method (default: xor)')
     
     # Method-specific arguments
-    encrypt_parser.add_argument('--key', type=int, default=123, 
+    encrypt_parser.add_argument('--key', type=_byte, default=123, 
                               help='XOR key (0-255, default: 123)')
     encrypt_parser.add_argument('--operation', choices=['add', 'subtract', 'multiply', 'divide'], 
                               default='add', help='Arithmetic operation (default: add)')
     encrypt_parser.add_argument('--value', type=int, default=50, 
                               help='Value for arithmetic operations (default: 50)')
-    encrypt_parser.add_argument('--shift-amount', type=int, default=2, 
-                              help='Number of bits to shift (default: 2)')
+    encrypt_parser.add_argument('--shift-amount', type=_shift_amount, default=2, 
+                              help='Number of bits to shift (0-8, default: 2)')
     encrypt_parser.add_argument('--direction', choices=['left', 'right'], default='left',
                               help='Bit shift direction (default: left)')
-    encrypt_parser.add_argument('--swap-percentage', type=float, default=0.5,
+    encrypt_parser.add_argument('--swap-percentage', type=_fraction, default=0.5,
                               help='Percentage of pixels to swap (0.0-1.0, default: 0.5)')
-    encrypt_parser.add_argument('--block-size', type=int, default=2,
+    encrypt_parser.add_argument('--block-size', type=_positive_int, default=2,
                               help='Block size for block swap (default: 2)')
     encrypt_parser.add_argument('--seed', type=int, help='Random seed for reproducible results')
     
@@ -73,31 +113,31 @@ Examples:
     decrypt_parser = subparsers.add_parser('decrypt', help='Decrypt an image')
     decrypt_parser.add_argument('input', help='Path to encrypted image')
     decrypt_parser.add_argument('output', help='Path to save decrypted image')
-    decrypt_parser.add_argument('--method', choices=[
-        'xor', 'arithmetic', 'bit_shift', 'adjacent_swap', 
-        'random_swap', 'block_swap', 'channel_shift'
-    ], default='xor', help='Decryption method (must match encryption method)')
+    decrypt_parser.add_argument('--method', choices=list(_METHOD_KWARGS), default='xor', help='Decryption method (must match encryption method)')
     
     # Same method-specific arguments for decryption
-    decrypt_parser.add_argument('--key', type=int, default=123, 
+    decrypt_parser.add_argument('--key', type=_byte, default=123, 
                               help='XOR key used for encryption (0-255, default: 123)')
     decrypt_parser.add_argument('--operation', choices=['add', 'subtract', 'multiply', 'divide'], 
                               default='add', help='Arithmetic operation used for encryption')
     decrypt_parser.add_argument('--value', type=int, default=50, 
                               help='Value used for arithmetic operations during encryption')
-    decrypt_parser.add_argument('--shift-amount', type=int, default=2, 
-                              help='Number of bits shifted during encryption')
+    decrypt_parser.add_argument('--shift-amount', type=_shift_amount, default=2, 
+                              help='Number of bits shifted during encryption (0-8)')
     decrypt_parser.add_argument('--direction', choices=['left', 'right'], default='left',
                               help='Bit shift direction used during encryption')
-    decrypt_parser.add_argument('--swap-percentage', type=float, default=0.5,
+    decrypt_parser.add_argument('--swap-percentage', type=_fraction, default=0.5,
                               help='Percentage of pixels swapped during encryption')
-    decrypt_parser.add_argument('--block-size', type=int, default=2,
+    decrypt_parser.add_argument('--block-size', type=_positive_int, default=2,
                               help='Block size used during encryption')
     decrypt_parser.add_argument('--seed', type=int, help='Random seed used for encryption')
     
     # Demo command
     demo_parser = subparsers.add_parser('demo', help='Run demonstration with a sample image')
-    demo_parser.add_argument('--input', help='Path to input image (will create sample if not provided)')
+    demo_parser.add_argument('--input', help='Path to input image or uint8 .npy array '
+                                              '(will create sample if not provided)')
+    demo_parser.add_argument('--no-save', action='store_true',
+                           help='Keep results in memory, report timings and round-trip checks instead of saving files')
     
     args = parser.parse_args()
     
@@ -111,6 +151,8 @@ Examples:
         elif args.command == 'decrypt':
             decrypt_image(args)
         elif args.command == 'demo':
+            # The demo lives in its own module so other commands never load it
+            from demo import run_demo
             run_demo(args)
     except Exception as e:
         print(f"Error: {e}")
@@ -123,23 +165,14 @@ def encrypt_image(args):
     if not os.path.exists(args.input):
         raise FileNotFoundError(f"Input file not found: {args.input}")
     
+    # Imported here so argument errors don't pay for loading PIL and NumPy
+    from image_encryptor import ImageEncryptor
+    
     # Create encryptor
     encryptor = ImageEncryptor(seed=args.seed)
     
     # Prepare kwargs based on method
-    kwargs = {}
-    if args.method == 'xor':
-        kwargs['key'] = args.key
-    elif args.method == 'arithmetic':
-        kwargs['operation'] = args.operation
-        kwargs['value'] = args.value
-    elif args.method == 'bit_shift':
-        kwargs['shift_amount'] = args.shift_amount
-        kwargs['direction'] = args.direction
-    elif args.method == 'random_swap':
-        kwargs['swap_percentage'] = args.swap_percentage
-    elif args.method == 'block_swap':
-        kwargs['block_size'] = args.block_size
+    kwargs = {name: getattr(args, name) for name in _METHOD_KWARGS[args.method]}
     
     # Encrypt image
     encryptor.encrypt_image(args.input, args.output, args.method, **kwargs)
@@ -151,102 +184,17 @@ def decrypt_image(args):
     if not os.path.exists(args.input):
         raise FileNotFoundError(f"Encrypted file not found: {args.input}")
     
+    from image_encryptor import ImageEncryptor
+    
     # Create encryptor
     encryptor = ImageEncryptor(seed=args.seed)
     
     # Prepare kwargs based on method
-    kwargs = {}
-    if args.method == 'xor':
-        kwargs['key'] = args.key
-    elif args.method == 'arithmetic':
-        kwargs['operation'] = args.operation
-        kwargs['value'] = args.value
-    elif args.method == 'bit_shift':
-        kwargs['shift_amount'] = args.shift_amount
-        kwargs['direction'] = args.direction
-    elif args.method == 'random_swap':
-        kwargs['swap_percentage'] = args.swap_percentage
-    elif args.method == 'block_swap':
-        kwargs['block_size'] = args.block_size
+    kwargs = {name: getattr(args, name) for name in _METHOD_KWARGS[args.method]}
     
     # Decrypt image
     encryptor.decrypt_image(args.input, args.output, args.method, **kwargs)
 
 
-def run_demo(args):
-    """Run a demonstration with different encryption methods"""
-    import numpy as np
-    from PIL import Image
-    
-    # Create or use provided input image
-    if args.input and os.path.exists(args.input):
-        input_image = args.input
-        print(f"Using provided image: {input_image}")
-    else:
-        # Create a simple test image
-        input_image = "sample_input.jpg"
-        print("Creating sample image for demonstration...")
-        
-        # Create a colorful test image
-        width, height = 200, 200
-        image_array = np.zeros((height, width, 3), dtype=np.uint8)
-        
-        # Create gradient patterns
-        for i in range(height):
-            for j in range(width):
-                image_array[i, j] = [
-                    (i * 255) // height,  # Red gradient
-                    (j * 255) // width,   # Green gradient  
-                    ((i + j) * 255) // (height + width)  # Blue gradient
-                ]
-        
-        # Save sample image
-        sample_image = Image.fromarray(image_array, 'RGB')
-        sample_image.save(input_image)
-        print(f"Sample image created: {input_image}")
-    
-    # Demo different encryption methods
-    methods_to_demo = [
-        ('xor', {'key': 150}),
-        ('arithmetic', {'operation': 'add', 'value': 75}),
-        ('bit_shift', {'shift_amount': 3, 'direction': 'left'}),
-        ('adjacent_swap', {}),
-        ('random_swap', {'swap_percentage': 0.3}),
-        ('block_swap', {'block_size': 4}),
-        ('channel_shift', {})
-    ]
-    
-    encryptor = ImageEncryptor(seed=42)  # Fixed seed for reproducible demo
-    
-    print(f"\nRunning demonstration with {len(methods_to_demo)} encryption methods:")
-    print("=" * 60)
-    
-    for method, kwargs in methods_to_demo:
-        encrypted_file = f"demo_encrypted_{method}.jpg"
-        decrypted_file = f"demo_decrypted_{method}.jpg"
-        
-        print(f"\n{method.upper()} Method:")
-        print(f"  Parameters: {kwargs}")
-        
-        try:
-            # Encrypt
-            encryptor.encrypt_image(input_image, encrypted_file, method, **kwargs)
-            
-            # Decrypt (for reversible methods)
-            if method in ['xor', 'arithmetic', 'bit_shift', 'adjacent_swap', 'channel_shift']:
-                encryptor.decrypt_image(encrypted_file, decrypted_file, method, **kwargs)
-                print(f"  Decrypted: {decrypted_file}")
-            else:
-                print(f"  Note: {method} requires same random seed for exact reversal")
-        
-        except Exception as e:
-            print(f"  Error with {method}: {e}")
-    
-    print(f"\nDemo complete! Check the generated files in the current directory.")
-    print("Original:", input_image)
-    print("Encrypted files: demo_encrypted_*.jpg")
-    print("Decrypted files: demo_decrypted_*.jpg")
-
-
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,166 @@
+"""
+Demonstration mode for the Image Encryption Tool
+
+This module implements the ``demo`` command of the CLI. It runs every
+encryption method on a sample image and writes the results to the current
+directory.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image
+from image_encryptor import ImageEncryptor
+
+
+# Methods run by the demo, with the parameters used for each
+_DEMO_METHODS = (
+    ('xor', {'key': 150}),
+    ('arithmetic', {'operation': 'add', 'value': 75}),
+    ('bit_shift', {'shift_amount': 3, 'direction': 'left'}),
+    ('adjacent_swap', {}),
+    ('random_swap', {'swap_percentage': 0.3}),
+    ('block_swap', {'block_size': 4}),
+    ('channel_shift', {}),
+)
+
+# Methods that are their own inverse, so decrypting right after encrypting
+# always gives back the original. Random swap qualifies because the seeded
+# encryptor swaps the same pairs every time; channel_shift is a 3-cycle and
+# is not included.
+_INVOLUTIVE_METHODS = frozenset({'xor', 'adjacent_swap', 'random_swap'})
+
+# Decoded demo image and output setting, set in each worker process by _init_demo_worker
+_demo_image = None
+_save_results = True
+
+
+def _init_demo_worker(source, save_results):
+    """Store the demo image (an array or a .npy path) and output setting in a worker process"""
+    global _demo_image, _save_results
+    if isinstance(source, str):
+        source = np.load(source, mmap_mode='r')
+    _demo_image = source
+    _save_results = save_results
+
+
+def _demo_method(method_and_kwargs):
+    """Run one demo method in a worker process and return its summary row"""
+    method, kwargs = method_and_kwargs
+    encryptor = ImageEncryptor(seed=42)  # Fixed seed for reproducible demo
+    
+    # Lossless PNG keeps the decrypted output exact; low compression keeps it fast
+    encrypted_file = f"demo_encrypted_{method}.png"
+    decrypted_file = f"demo_decrypted_{method}.png"
+    
+    parameters = ", ".join(f"{name}={value}" for name, value in kwargs.items()) or "-"
+    
+    try:
+        # Saving runs on a background thread so PNG encoding overlaps with decryption
+        with ThreadPoolExecutor(max_workers=1) as save_pool:
+            saves = []
+            
+            # Encrypt
+            start = time.perf_counter()
+            encrypted_array = encryptor.encrypt_array(_demo_image, method, **kwargs)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if _save_results:
+                saves.append(save_pool.submit(encryptor.save_image, encrypted_array, encrypted_file,
+                                              compress_level=1))
+                encrypted = encrypted_file
+            else:
+                encrypted = f"{elapsed_ms:.2f} ms"
+            
+            # Decrypt straight from the in-memory result; the fixed seed lets the
+            # same encryptor undo the random methods too. Saved runs skip the
+            # self-inverse methods, whose decrypted file would match the original
+            if _save_results and method in _INVOLUTIVE_METHODS:
+                decrypted = "skipped (its own inverse)"
+            else:
+                decrypted_array = encryptor.decrypt_array(encrypted_array, method, **kwargs)
+                if _save_results:
+                    saves.append(save_pool.submit(encryptor.save_image, decrypted_array, decrypted_file,
+                                                  compress_level=1))
+                    decrypted = decrypted_file
+                elif np.array_equal(_demo_image, decrypted_array):
+                    decrypted = "exact round trip"
+                else:
+                    # Arithmetic and bit shifting clip to [0, 255], which loses information
+                    decrypted = "differs from original"
+            
+            # Surface any error raised while saving
+            for save in saves:
+                save.result()
+    
+    except Exception as e:
+        encrypted, decrypted = "error", str(e)
+    
+    return method, parameters, encrypted, decrypted
+
+
+def run_demo(args):
+    """Run a demonstration with different encryption methods"""
+    # Create or use provided input image
+    if args.input and os.path.exists(args.input):
+        input_image = args.input
+        print(f"Using provided image: {input_image}")
+    else:
+        # Create a simple test image
+        input_image = "sample_input.jpg"
+        print("Creating sample image for demonstration...")
+        
+        # Create a colorful test image
+        width, height = 200, 200
+        image_array = np.zeros((height, width, 3), dtype=np.uint8)
+        
+        # Create gradient patterns from broadcast row/column indices
+        rows = np.arange(height)[:, None]
+        cols = np.arange(width)[None, :]
+        image_array[:, :, 0] = (rows * 255) // height  # Red gradient
+        image_array[:, :, 1] = (cols * 255) // width   # Green gradient
+        image_array[:, :, 2] = ((rows + cols) * 255) // (height + width)  # Blue gradient
+        
+        # Save sample image
+        sample_image = Image.fromarray(image_array, 'RGB')
+        sample_image.save(input_image)
+        print(f"Sample image created: {input_image}")
+    
+    if input_image.endswith('.npy'):
+        # Raw arrays are memory-mapped, which skips image decoding entirely
+        image_array = np.load(input_image, mmap_mode='r')
+        if image_array.dtype != np.uint8 or image_array.ndim != 3 or image_array.shape[2] != 3:
+            raise ValueError(f"Expected a uint8 array of shape (height, width, 3), "
+                             f"got {image_array.dtype} {image_array.shape}")
+        # Workers map the file themselves instead of receiving a pickled copy
+        worker_source = input_image
+    else:
+        # Decode the input once and share the array with every worker; it is only read
+        worker_source = ImageEncryptor().load_image(input_image, writeable=False)
+    
+    print(f"\nRunning demonstration with {len(_DEMO_METHODS)} encryption methods...")
+    
+    # The methods are independent, so run them in parallel worker processes
+    max_workers = min(len(_DEMO_METHODS), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_demo_worker,
+                             initargs=(worker_source, not args.no_save)) as executor:
+        rows = list(executor.map(_demo_method, _DEMO_METHODS))
+    
+    # Report every method at once as a single table
+    header = ("Method", "Parameters", "Encrypted", "Decrypted")
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(3)]
+    lines = [f"{m:<{widths[0]}}  {p:<{widths[1]}}  {e:<{widths[2]}}  {d}" for m, p, e, d in [header] + rows]
+    lines.insert(1, "=" * max(len(line) for line in lines))
+    print("\n" + "\n".join(lines))
+    
+    if args.no_save:
+        print("\nDemo complete! Results were kept in memory and not saved.")
+        return
+    
+    print(f"\nDemo complete! Check the generated files in the current directory.")
+    print("Original:", input_image)
+    print("Encrypted files: demo_encrypted_*.png")
+    skipped = ", ".join(method for method, _ in _DEMO_METHODS if method in _INVOLUTIVE_METHODS)
+    print(f"Decrypted files: demo_decrypted_*.png (none for {skipped}, which are their own inverse)")
+
@@ -12,6 +12,10 @@ from PIL import Image
 from image_encryptor import ImageEncryptor
 
 
+# Rows generated per tile in create_sample_image
+_TILE_ROWS = 32
+
+
 def create_sample_image(filename="example_input.jpg", size=(300, 300)):
     """Create a sample image for testing"""
     print(f"Creating sample image: {filename}")
@@ -19,28 +23,46 @@ def create_sample_image(filename="example_input.jpg", size=(300, 300)):
     width, height = size
     image_array = np.zeros((height, width, 3), dtype=np.uint8)
     
-    # Create a more interesting pattern
-    for i in range(height):
-        for j in range(width):
-            # Create geometric patterns
-            r = int(128 + 127 * np.sin(i * 0.1) * np.cos(j * 0.1))
-            g = int(128 + 127 * np.sin((i + j) * 0.05))
-            b = int(128 + 127 * np.cos(i * 0.08) * np.sin(j * 0.08))
-            
-            image_array[i, j] = [r, g, b]
-    
-    # Add some geometric shapes
-    # Add a circle
+    # Column terms are shared by every row, so compute them once
+    cols = np.arange(width)[None, :]
+    j = cols.astype(np.float32)
+    cos_j = np.cos(j * 0.1)
+    sin_j = np.sin(j * 0.08)
+    
+    # The green pattern only depends on i + j, so precompute it as a lookup table
+    green_lut = (128 + 127 * np.sin(np.arange(height + width - 1) * 0.05)).astype(np.uint8)
+    
+    # Circle geometry
     center_x, center_y = width // 2, height // 2
     radius = min(width, height) // 4
     
-    for i in range(height):
-        for j in range(width):
-            distance = np.sqrt((i - center_y)**2 + (j - center_x)**2)
-            if distance < radius:
-                image_array[i, j] = [255, 255, 255]  # White circle
-            elif distance < radius + 10:
-                image_array[i, j] = [0, 0, 0]  # Black border
+    # Generate the image in row tiles so the float32 temporaries stay cache-sized
+    tile = np.empty((_TILE_ROWS, width), dtype=np.float32)
+    for y0 in range(0, height, _TILE_ROWS):
+        y1 = min(y0 + _TILE_ROWS, height)
+        rows = np.arange(y0, y1)[:, None]
+        i = rows.astype(np.float32)
+        out = image_array[y0:y1]
+        t = tile[:y1 - y0]
+        
+        # Create a more interesting pattern
+        np.multiply(np.sin(i * 0.1), cos_j, out=t)
+        t *= 127
+        t += 128
+        out[:, :, 0] = t
+        
+        out[:, :, 1] = green_lut[rows + cols]
+        
+        np.multiply(np.cos(i * 0.08), sin_j, out=t)
+        t *= 127
+        t += 128
+        out[:, :, 2] = t
+        
+        # Add some geometric shapes
+        # Add a circle, comparing squared distances to avoid the square root
+        distance_sq = (rows - center_y)**2 + (cols - center_x)**2
+        out[distance_sq < (radius + 10)**2] = [0, 0, 0]  # Black border
+        out[distance_sq < radius**2] = [255, 255, 255]  # White circle
     
     # Save image
     sample_image = Image.fromarray(image_array, 'RGB')
@@ -200,19 +222,20 @@ def demonstrate_api_usage():
     # Chain multiple transformations
     print("\nChaining multiple transformations:")
     
-    # Start with original image
-    chained_result = image_array.copy()
+    # Start with a single working copy of the original image; every step
+    # writes into it via out= instead of allocating a new array
+    working = image_array.copy()
     
     # Apply XOR
-    chained_result = encryptor.xor_encrypt(chained_result, key=100)
+    encryptor.xor_encrypt(working, key=100, out=working)
     print("  → Applied XOR encryption")
     
     # Apply bit shifting
-    chained_result = encryptor.bit_shift_encrypt(chained_result, shift_amount=2, direction='left')
+    encryptor.bit_shift_encrypt(working, shift_amount=2, direction='left', out=working)
     print("  → Applied bit shifting")
     
-    # Apply pixel swapping
-    chained_result = encryptor.swap_adjacent_pixels(chained_result)
+    # Apply pixel swapping into a second buffer, keeping the state before the swap
+    chained_result = encryptor.swap_adjacent_pixels(working)
     print("  → Applied adjacent pixel swapping")
     
     # Save result
@@ -222,16 +245,17 @@ def demonstrate_api_usage():
     # Reverse the transformations
     print("\nReversing transformations:")
     
-    # Reverse adjacent pixel swapping
-    reversed_result = encryptor.swap_adjacent_pixels(chained_result)
-    print("  → Reversed adjacent pixel swapping")
+    # Adjacent swapping is its own inverse, so undoing it right after the final
+    # encryption step cancels out: continue from the buffer before the swap
+    reversed_result = working
+    print("  → Reversed adjacent pixel swapping (cancels out, skipped)")
     
     # Reverse bit shifting
-    reversed_result = encryptor.bit_shift_encrypt(reversed_result, shift_amount=2, direction='right')
+    encryptor.bit_shift_encrypt(reversed_result, shift_amount=2, direction='right', out=reversed_result)
     print("  → Reversed bit shifting")
     
     # Reverse XOR
-    reversed_result = encryptor.xor_encrypt(reversed_result, key=100)
+    encryptor.xor_encrypt(reversed_result, key=100, out=reversed_result)
     print("  → Reversed XOR encryption")
     
     # Save final result
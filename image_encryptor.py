@@ -5,12 +5,241 @@ This module provides functionality to encrypt and decrypt images using various
 pixel manipulation techniques including pixel swapping and mathematical operations.
 """
 
-import random
 from PIL import Image
 import numpy as np
-from typing import Tuple, List, Union
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
 
+try:
+    # Optional: libjpeg-turbo bindings decode and encode JPEGs faster than PIL
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420
+except ImportError:
+    TurboJPEG = None
+
+
+_JPEG_EXTENSIONS = ('.jpg', '.jpeg')
+
+
+def _is_jpeg_path(path):
+    """Whether path is a filesystem path (str, bytes or os.PathLike) with a JPEG extension"""
+    # Anything else, such as an open file object, is left to PIL
+    return isinstance(path, (str, bytes, os.PathLike)) and os.fsdecode(path).lower().endswith(_JPEG_EXTENSIONS)
+
+
+@lru_cache(maxsize=None)
+def _turbo_jpeg():
+    """Shared TurboJPEG codec, or None when PyTurboJPEG or libturbojpeg is missing"""
+    if TurboJPEG is None:
+        return None
+    try:
+        return TurboJPEG()
+    except (OSError, RuntimeError):
+        return None
+
+
+# Encryption methods: name -> (ImageEncryptor method, default keyword arguments)
+_ENCRYPT_OPS = MappingProxyType({
+    'xor': ('xor_encrypt', {'key': 123}),
+    'arithmetic': ('arithmetic_encrypt', {'operation': 'add', 'value': 50}),
+    'bit_shift': ('bit_shift_encrypt', {'shift_amount': 2, 'direction': 'left'}),
+    'adjacent_swap': ('swap_adjacent_pixels', {}),
+    'random_swap': ('swap_random_pixels', {'swap_percentage': 0.5}),
+    'block_swap': ('swap_block_pixels', {'block_size': 2}),
+    'channel_shift': ('color_channel_shift', {}),
+})
+
+# Methods that accept out= and can therefore overwrite their input
+_IN_PLACE_METHODS = frozenset({'xor', 'arithmetic', 'bit_shift', 'adjacent_swap'})
+
+# Methods whose inverse depends on replaying the same random draws, which
+# only a seeded encryptor can do
+_SEEDED_METHODS = frozenset({'random_swap', 'block_swap'})
+
+_ARITHMETIC_INVERSES = MappingProxyType({
+    'add': 'subtract',
+    'subtract': 'add',
+    'multiply': 'divide',
+    'divide': 'multiply',
+})
+
+
+def _reverse_arithmetic(params):
+    """Arguments that undo an arithmetic_encrypt call"""
+    operation, value = params['operation'], params['value']
+    if operation not in _ARITHMETIC_INVERSES or (operation == 'multiply' and value == 0):
+        raise ValueError(f"Cannot reverse operation: {operation}")
+    return {'operation': _ARITHMETIC_INVERSES[operation], 'value': value}
+
+
+def _reverse_bit_shift(params):
+    """Arguments that undo a bit_shift_encrypt call"""
+    reverse_direction = 'right' if params['direction'] == 'left' else 'left'
+    return {'shift_amount': params['shift_amount'], 'direction': reverse_direction}
+
+
+def _inverse_permutation(params):
+    """Arguments that undo a permutation method"""
+    return {**params, 'inverse': True}
+
+
+# Decryption: name -> function turning the encryption arguments into the ones
+# that undo it when passed to the same ImageEncryptor method. XOR, adjacent swap
+# and random swap are their own inverses.
+_DECRYPT_PARAMS = MappingProxyType({
+    'xor': dict,
+    'arithmetic': _reverse_arithmetic,
+    'bit_shift': _reverse_bit_shift,
+    'adjacent_swap': dict,
+    'random_swap': dict,
+    'block_swap': _inverse_permutation,
+    'channel_shift': _inverse_permutation,
+})
+
+
+# Pixel-wise kernels split large images across threads from this many array
+# elements up; below it thread dispatch costs more than it saves
+_PARALLEL_MIN_SIZE = 4_000_000
+
+# Pixels per band in swap_block_pixels; with the band's permutation tables this
+# keeps the working set around the size of a typical L2 cache
+_BLOCK_BAND_PIXELS = 1 << 17
+
+
+@lru_cache(maxsize=None)
+def _row_pool():
+    """Thread pool shared by the pixel-wise kernels, created on first use"""
+    return ThreadPoolExecutor(os.cpu_count())
+
+
+def _map_row_bands(kernel, image_array, out):
+    """
+    Apply kernel(rows, out_rows) to the whole image, split into one band of rows
+    per core when the image is large. NumPy ufuncs release the GIL, so the bands
+    run truly in parallel.
+    
+    Args:
+        kernel (callable): Writes the result for a band of rows into out_rows
+        image_array (np.ndarray): Input image array
+        out (np.ndarray): Array of the same shape to write the result into
+    """
+    workers = os.cpu_count() or 1
+    if workers == 1 or image_array.size < _PARALLEL_MIN_SIZE:
+        kernel(image_array, out)
+        return
+    
+    band_rows = -(-len(image_array) // workers)
+    bands = [slice(start, start + band_rows) for start in range(0, len(image_array), band_rows)]
+    # list() waits for every band and re-raises the first error
+    list(_row_pool().map(lambda band: kernel(image_array[band], out[band]), bands))
+
+
+def _draw_swap_positions(rng, num_pixels, num_swaps):
+    """
+    Draw distinct pixel positions for random swapping; consecutive positions form swap pairs.
+    
+    Args:
+        rng (np.random.Generator): Source of randomness
+        num_pixels (int): Number of pixels in the image
+        num_swaps (int): Number of pixel pairs to swap
+        
+    Returns:
+        np.ndarray: 2 * num_swaps flat pixel positions
+    """
+    positions = np.arange(num_pixels, dtype=np.min_scalar_type(num_pixels))
+    rng.shuffle(positions)
+    # Copy so the unused tail of the shuffle is not kept alive
+    return positions[:num_swaps * 2].copy()
+
+
+def _block_regions(height, width, block_size):
+    """
+    Split an image into regions that are each tiled exactly by one block shape: the
+    full blocks, the partial blocks along the right and bottom edges, and the corner.
+    
+    Args:
+        height (int): Image height
+        width (int): Image width
+        block_size (int): Size of the full blocks
+        
+    Returns:
+        Tuple[tuple, ...]: (rows, cols, block_height, block_width) for every non-empty region
+    """
+    full_height = height - height % block_size
+    full_width = width - width % block_size
+    edge_height, edge_width = height - full_height, width - full_width
+    
+    regions = (
+        (slice(0, full_height), slice(0, full_width), block_size, block_size),
+        (slice(0, full_height), slice(full_width, width), block_size, edge_width),
+        (slice(full_height, height), slice(0, full_width), edge_height, block_size),
+        (slice(full_height, height), slice(full_width, width), edge_height, edge_width),
+    )
+    return tuple(region for region in regions
+                 if region[0].stop > region[0].start and region[1].stop > region[1].start)
+
+
+def _band_block_rows(block_height, width):
+    """Block rows per band, so a band's copies and permutation tables stay in L2"""
+    return max(1, _BLOCK_BAND_PIXELS // (block_height * width))
+
+
+def _draw_block_permutations(rng, height, width, block_size):
+    """
+    Draw one random permutation of pixel slots per block: pixel k of a block
+    moves to slot permutations[block, k].
+    
+    Args:
+        rng (np.random.Generator): Source of randomness
+        height (int): Image height
+        width (int): Image width
+        block_size (int): Size of the full blocks
+        
+    Returns:
+        Tuple[np.ndarray, ...]: (num_blocks, block_pixels) table for each region of _block_regions
+    """
+    tables = []
+    for rows, cols, block_height, block_width in _block_regions(height, width, block_size):
+        region_width = cols.stop - cols.start
+        block_rows = (rows.stop - rows.start) // block_height
+        block_cols = region_width // block_width
+        block_pixels = block_height * block_width
+        
+        # Slot numbers fit in a byte for blocks up to 16x16
+        permutations = np.empty((block_rows * block_cols, block_pixels), dtype=np.min_scalar_type(block_pixels - 1))
+        
+        # Draw band by band so the uniform draws and argsort stay cache-sized
+        band_blocks = _band_block_rows(block_height, region_width) * block_cols
+        for start in range(0, len(permutations), band_blocks):
+            band = permutations[start:start + band_blocks]
+            band[...] = np.argsort(rng.random(band.shape), axis=1)
+        tables.append(permutations)
+    return tuple(tables)
+
+
+# Permutations of seeded encryptors depend only on (seed, image shape, parameters),
+# so encrypting again or decrypting reuses them instead of redrawing. Each cache
+# keeps up to _PERMUTATION_CACHE_SIZE tables alive until ImageEncryptor.clear_cache()
+# is called: about 4 bytes per swapped pixel for random swap (33 MB for a 4K image
+# at 100%) and 1 byte per pixel for block swap with blocks up to 16x16.
+_PERMUTATION_CACHE_SIZE = 4
+
+
+@lru_cache(maxsize=_PERMUTATION_CACHE_SIZE)
+def _seeded_swap_positions(seed, num_pixels, num_swaps):
+    positions = _draw_swap_positions(np.random.default_rng(seed), num_pixels, num_swaps)
+    positions.flags.writeable = False
+    return positions
+
+
+@lru_cache(maxsize=_PERMUTATION_CACHE_SIZE)
+def _seeded_block_permutations(seed, height, width, block_size):
+    tables = _draw_block_permutations(np.random.default_rng(seed), height, width, block_size)
+    for permutations in tables:
+        permutations.flags.writeable = False
+    return tables
+
 
 class ImageEncryptor:
     """
@@ -25,86 +254,131 @@ class ImageEncryptor:
             seed (int): Random seed for reproducible encryption/decryption
         """
         self.seed = seed
-        if seed:
-            random.seed(seed)
-            np.random.seed(seed)
+        # One generator per instance; every random method draws from it in bulk
+        self.rng = np.random.default_rng(seed)
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Release the permutation tables cached for seeded random and block swaps.
+        
+        Seeded encryptors share these tables across instances so decryption can
+        reuse them; long-running processes can call this to free their memory.
+        """
+        _seeded_swap_positions.cache_clear()
+        _seeded_block_permutations.cache_clear()
     
-    def load_image(self, image_path: str) -> np.ndarray:
+    def load_image(self, image_path: str, writeable: bool = True) -> np.ndarray:
         """
         Load an image and convert it to a numpy array.
         
         Args:
             image_path (str): Path to the image file
+            writeable (bool): Return an array that may be modified in place, copying
+                the pixels only if the decoded buffer is read-only. Pass False to skip
+                that copy when the array is only read; it may then be read-only.
             
         Returns:
             np.ndarray: Image as numpy array
         """
         try:
+            jpeg = _turbo_jpeg()
+            if jpeg is not None and _is_jpeg_path(image_path):
+                # libjpeg-turbo decodes straight into a new, writable RGB array
+                with open(image_path, 'rb') as image_file:
+                    data = image_file.read()
+                try:
+                    return jpeg.decode(data, pixel_format=TJPF_RGB)
+                except OSError:
+                    pass  # e.g. CMYK JPEGs, which PIL converts below
+            
             image = Image.open(image_path)
             # Convert to RGB if not already
             if image.mode != 'RGB':
                 image = image.convert('RGB')
-            return np.array(image)
+            # asarray wraps PIL's pixel buffer instead of copying it again
+            image_array = np.asarray(image)
+            if writeable and not image_array.flags.writeable:
+                image_array = image_array.copy()
+            return image_array
         except Exception as e:
             raise ValueError(f"Error loading image: {e}")
     
-    def save_image(self, image_array: np.ndarray, output_path: str) -> None:
+    def save_image(self, image_array: np.ndarray, output_path: str, **save_options) -> None:
         """
         Save a numpy array as an image file.
         
         Args:
             image_array (np.ndarray): Image array to save
             output_path (str): Output file path
+            **save_options: Format-specific options passed to PIL (e.g. compress_level)
         """
         try:
-            # Ensure values are in valid range [0, 255]
-            image_array = np.clip(image_array, 0, 255).astype(np.uint8)
+            # Ensure values are in valid range [0, 255]; uint8 input already is
+            if image_array.dtype != np.uint8:
+                image_array = np.clip(image_array, 0, 255).astype(np.uint8)
+            
+            jpeg = _turbo_jpeg()
+            if (jpeg is not None and _is_jpeg_path(output_path)
+                    and set(save_options) <= {'quality'}):
+                # Same quality default and chroma subsampling as PIL's JPEG writer
+                encoded = jpeg.encode(np.ascontiguousarray(image_array), quality=save_options.get('quality', 75),
+                                      pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420)
+                with open(output_path, 'wb') as image_file:
+                    image_file.write(encoded)
+                return
+            
             image = Image.fromarray(image_array, 'RGB')
-            image.save(output_path)
+            image.save(output_path, **save_options)
         except Exception as e:
             raise ValueError(f"Error saving image: {e}")
     
-    def get_pixel_positions(self, height: int, width: int) -> List[Tuple[int, int]]:
+    def get_pixel_positions(self, height: int, width: int) -> np.ndarray:
         """
         Get all pixel positions in the image.
         
+        This is a standalone helper for callers working with flat positions;
+        swap_random_pixels draws its own, more compact position array.
+        
         Args:
             height (int): Image height
             width (int): Image width
             
         Returns:
-            List[Tuple[int, int]]: List of (row, col) positions
+            np.ndarray: Flat position (row * width + col) of every pixel;
+                np.divmod(positions, width) recovers (row, col)
         """
-        positions = []
-        for i in range(height):
-            for j in range(width):
-                positions.append((i, j))
-        return positions
+        return np.arange(height * width, dtype=np.int64)
     
     # =========================
     # PIXEL SWAPPING METHODS
     # =========================
     
-    def swap_adjacent_pixels(self, image_array: np.ndarray) -> np.ndarray:
+    def swap_adjacent_pixels(self, image_array: np.ndarray, out: np.ndarray = None) -> np.ndarray:
         """
         Swap adjacent pixels in pairs (horizontally).
         
         Args:
             image_array (np.ndarray): Input image array
+            out (np.ndarray, optional): Array to write the result into
+                (may be image_array itself to swap in place)
             
         Returns:
             np.ndarray: Image with adjacent pixels swapped
         """
-        encrypted_image = image_array.copy()
-        height, width = encrypted_image.shape[:2]
+        height, width = image_array.shape[:2]
+        paired_width = width - width % 2  # A trailing odd column stays in place
         
-        # Swap adjacent pixels horizontally
-        for i in range(height):
-            for j in range(0, width - 1, 2):  # Step by 2 to swap pairs
-                # Swap pixels at (i, j) and (i, j+1)
-                temp = encrypted_image[i, j].copy()
-                encrypted_image[i, j] = encrypted_image[i, j + 1]
-                encrypted_image[i, j + 1] = temp
+        if out is None:
+            encrypted_image = image_array.copy()
+        else:
+            encrypted_image = out
+            if out is not image_array:
+                encrypted_image[:, paired_width:] = image_array[:, paired_width:]
+        
+        # View each row as (pairs, 2, ...) and reverse every pair in one operation
+        pairs = image_array[:, :paired_width].reshape(height, paired_width // 2, 2, *image_array.shape[2:])
+        encrypted_image[:, :paired_width] = pairs[:, :, ::-1].reshape(height, paired_width, *image_array.shape[2:])
         
         return encrypted_image
     
@@ -121,70 +395,99 @@ class ImageEncryptor:
         """
         encrypted_image = image_array.copy()
         height, width = encrypted_image.shape[:2]
+        num_pixels = height * width
         
-        # Get all pixel positions
-        positions = self.get_pixel_positions(height, width)
+        # An empty image has nothing to swap, and its pixel view below cannot be formed
+        if num_pixels == 0:
+            return encrypted_image
         
         # Determine number of swaps
-        num_swaps = int(len(positions) * swap_percentage / 2)  # Divide by 2 since each swap affects 2 pixels
+        num_swaps = max(0, min(int(num_pixels * swap_percentage / 2), num_pixels // 2))  # Each swap affects 2 pixels
         
-        # Randomly select positions to swap
-        random.shuffle(positions)
+        # Randomly select distinct positions; consecutive positions form swap pairs
+        if self.seed is None:
+            positions = _draw_swap_positions(self.rng, num_pixels, num_swaps)
+        else:
+            positions = _seeded_swap_positions(self.seed, num_pixels, num_swaps)
+        first, second = positions[0::2], positions[1::2]
         
-        for i in range(0, min(num_swaps * 2, len(positions)), 2):
-            if i + 1 < len(positions):
-                pos1 = positions[i]
-                pos2 = positions[i + 1]
-                
-                # Swap pixels
-                temp = encrypted_image[pos1[0], pos1[1]].copy()
-                encrypted_image[pos1[0], pos1[1]] = encrypted_image[pos2[0], pos2[1]]
-                encrypted_image[pos2[0], pos2[1]] = temp
+        # The pairs never overlap, so every swap can be done at once. Viewing each
+        # pixel as one opaque element lets every swap move a single item.
+        flat_image = encrypted_image.reshape(num_pixels, -1)
+        pixels = flat_image.view(np.dtype((np.void, flat_image.shape[1] * flat_image.itemsize)))[:, 0]
+        pixels[first], pixels[second] = pixels[second], pixels[first]
         
         return encrypted_image
     
-    def swap_block_pixels(self, image_array: np.ndarray, block_size: int = 2) -> np.ndarray:
+    def _shuffle_blocks(self, region: np.ndarray, block_height: int, block_width: int,
+                        permutations: np.ndarray, out: np.ndarray, inverse: bool = False) -> None:
+        """
+        Shuffle pixels within every block of a region tiled exactly by the block shape.
+        
+        Args:
+            region (np.ndarray): Image region whose height and width are multiples of the block shape
+            block_height (int): Block height
+            block_width (int): Block width
+            permutations (np.ndarray): Slot each pixel of each block moves to, one row per block
+            out (np.ndarray): Array of the region's shape to write the shuffled pixels into
+            inverse (bool): Move pixels back from their slots instead
+        """
+        height, width = region.shape[:2]
+        pixel_shape = region.shape[2:]
+        block_rows, block_cols = height // block_height, width // block_width
+        block_pixels = block_height * block_width
+        
+        # Work through bands of block rows small enough that the band's copies stay in L2
+        band_block_rows = _band_block_rows(block_height, width)
+        for first_row in range(0, block_rows, band_block_rows):
+            band_rows = min(band_block_rows, block_rows - first_row)
+            num_blocks = band_rows * block_cols
+            rows = slice(first_row * block_height, (first_row + band_rows) * block_height)
+            slots = permutations[first_row * block_cols:first_row * block_cols + num_blocks]
+            block_index = np.arange(num_blocks)[:, None]
+            
+            # View blocks as (block, pixel within block) and shuffle them all at once
+            blocks = (region[rows]
+                      .reshape(band_rows, block_height, block_cols, block_width, *pixel_shape)
+                      .swapaxes(1, 2)
+                      .reshape(num_blocks, block_pixels, *pixel_shape))
+            if inverse:
+                shuffled = blocks[block_index, slots]
+            else:
+                shuffled = np.empty_like(blocks)
+                shuffled[block_index, slots] = blocks
+            out[rows] = (shuffled
+                         .reshape(band_rows, block_cols, block_height, block_width, *pixel_shape)
+                         .swapaxes(1, 2)
+                         .reshape(band_rows * block_height, width, *pixel_shape))
+    
+    def swap_block_pixels(self, image_array: np.ndarray, block_size: int = 2, inverse: bool = False) -> np.ndarray:
         """
         Swap pixels within blocks of specified size.
         
         Args:
             image_array (np.ndarray): Input image array
             block_size (int): Size of blocks to swap within
+            inverse (bool): Undo a shuffle made with the same seed and block size
             
         Returns:
             np.ndarray: Image with block-wise pixel swapping
         """
-        encrypted_image = image_array.copy()
+        # Every pixel is written below (full blocks, then edge blocks), so nothing is copied up front
+        encrypted_image = np.empty_like(image_array)
         height, width = encrypted_image.shape[:2]
         
-        # Process image in blocks
-        for i in range(0, height, block_size):
-            for j in range(0, width, block_size):
-                # Define block boundaries
-                i_end = min(i + block_size, height)
-                j_end = min(j + block_size, width)
-                
-                # Extract block
-                block = encrypted_image[i:i_end, j:j_end].copy()
-                block_height, block_width = block.shape[:2]
-                
-                # Get positions within the block
-                block_positions = []
-                for bi in range(block_height):
-                    for bj in range(block_width):
-                        block_positions.append((bi, bj))
-                
-                # Shuffle positions
-                shuffled_positions = block_positions.copy()
-                random.shuffle(shuffled_positions)
-                
-                # Create new block with shuffled positions
-                new_block = np.zeros_like(block)
-                for original_pos, new_pos in zip(block_positions, shuffled_positions):
-                    new_block[new_pos[0], new_pos[1]] = block[original_pos[0], original_pos[1]]
-                
-                # Place shuffled block back
-                encrypted_image[i:i_end, j:j_end] = new_block
+        if self.seed is None:
+            tables = _draw_block_permutations(self.rng, height, width, block_size)
+        else:
+            tables = _seeded_block_permutations(self.seed, height, width, block_size)
+        
+        # Full blocks, edge strips and the corner each tile their region exactly,
+        # so each region is shuffled as one batch
+        regions = _block_regions(height, width, block_size)
+        for (rows, cols, block_height, block_width), permutations in zip(regions, tables):
+            self._shuffle_blocks(image_array[rows, cols], block_height, block_width, permutations,
+                                 encrypted_image[rows, cols], inverse)
         
         return encrypted_image
     
@@ -192,60 +495,92 @@ class ImageEncryptor:
     # MATHEMATICAL OPERATIONS
     # =========================
     
-    def xor_encrypt(self, image_array: np.ndarray, key: int = 123) -> np.ndarray:
+    def xor_encrypt(self, image_array: np.ndarray, key: int = 123, out: np.ndarray = None) -> np.ndarray:
         """
         Apply XOR encryption to each pixel value.
         
         Args:
             image_array (np.ndarray): Input image array
             key (int): XOR key (0-255)
+            out (np.ndarray, optional): uint8 array to write the result into
+                (may be image_array itself to encrypt in place)
             
         Returns:
             np.ndarray: XOR encrypted image
         """
         # Ensure key is within valid range
-        key = key % 256
-        
-        # Apply XOR operation
-        encrypted_image = image_array.copy().astype(np.int32)
-        encrypted_image = encrypted_image ^ key
+        key = np.uint8(key % 256)
+        if out is None:
+            out = np.empty_like(image_array)
         
-        # Ensure values stay in valid range
-        encrypted_image = np.clip(encrypted_image, 0, 255).astype(np.uint8)
+        # Apply XOR operation; uint8 ^ uint8 always stays within [0, 255]
+        def kernel(rows, out_rows):
+            np.bitwise_xor(rows, key, out=out_rows)
         
-        return encrypted_image
+        _map_row_bands(kernel, image_array, out)
+        return out
     
-    def arithmetic_encrypt(self, image_array: np.ndarray, operation: str = 'add', value: int = 50) -> np.ndarray:
+    def arithmetic_encrypt(self, image_array: np.ndarray, operation: str = 'add', value: int = 50,
+                           out: np.ndarray = None) -> np.ndarray:
         """
         Apply arithmetic operations to pixel values.
         
         Args:
             image_array (np.ndarray): Input image array
             operation (str): 'add', 'subtract', 'multiply', or 'divide'
-            value (int): Value to use in the operation
+            value (int): Value to use in the operation (non-integer values are applied
+                in floating point and the result truncated)
+            out (np.ndarray, optional): uint8 array to write the result into
+                (may be image_array itself to encrypt in place)
             
         Returns:
             np.ndarray: Arithmetically modified image
         """
-        encrypted_image = image_array.copy().astype(np.int32)
-        
-        if operation == 'add':
-            encrypted_image = encrypted_image + value
-        elif operation == 'subtract':
-            encrypted_image = encrypted_image - value
+        # Non-integer values need a floating-point intermediate on every path
+        integer_value = isinstance(value, (int, np.integer))
+        
+        if operation in ('add', 'subtract'):
+            # Offsets beyond +/-255 saturate the same way, so int16 is wide enough
+            offset = max(-255, min(255, value if operation == 'add' else -value))
+            if out is not None and integer_value:
+                # Clamp first so the uint8 add/subtract cannot wrap, which needs no wider copy
+                if offset >= 0:
+                    clamp, shift, bound = np.minimum, np.add, np.uint8(255 - offset)
+                else:
+                    clamp, shift, bound = np.maximum, np.subtract, np.uint8(-offset)
+                step = np.uint8(abs(offset))
+                
+                def kernel(rows, out_rows):
+                    clamp(rows, bound, out=out_rows)
+                    shift(out_rows, step, out=out_rows)
+                
+                _map_row_bands(kernel, image_array, out)
+                return out
+            wide_op, wide_dtype, operand = np.add, np.int16, offset
         elif operation == 'multiply':
-            encrypted_image = encrypted_image * value
+            wide_op, wide_dtype, operand = np.multiply, np.int32, value
         elif operation == 'divide' and value != 0:
-            encrypted_image = encrypted_image // value
+            wide_op, wide_dtype, operand = np.floor_divide, np.int32, value
         else:
             raise ValueError(f"Unsupported operation: {operation}")
+        if not integer_value:
+            wide_dtype = np.float64
         
-        # Ensure values stay in valid range [0, 255]
-        encrypted_image = np.clip(encrypted_image, 0, 255).astype(np.uint8)
+        if out is None:
+            out = np.empty(image_array.shape, dtype=np.uint8)
         
-        return encrypted_image
+        def kernel(rows, out_rows):
+            encrypted_rows = rows.astype(wide_dtype)
+            wide_op(encrypted_rows, operand, out=encrypted_rows)
+            # Ensure values stay in valid range [0, 255]
+            np.clip(encrypted_rows, 0, 255, out=encrypted_rows)
+            np.copyto(out_rows, encrypted_rows, casting='unsafe')
+        
+        _map_row_bands(kernel, image_array, out)
+        return out
     
-    def bit_shift_encrypt(self, image_array: np.ndarray, shift_amount: int = 2, direction: str = 'left') -> np.ndarray:
+    def bit_shift_encrypt(self, image_array: np.ndarray, shift_amount: int = 2, direction: str = 'left',
+                          out: np.ndarray = None) -> np.ndarray:
         """
         Apply bit shifting to pixel values.
         
@@ -253,41 +588,56 @@ class ImageEncryptor:
             image_array (np.ndarray): Input image array
             shift_amount (int): Number of bits to shift
             direction (str): 'left' or 'right'
+            out (np.ndarray, optional): uint8 array to write the result into
+                (may be image_array itself to shift in place)
             
         Returns:
             np.ndarray: Bit-shifted image
         """
-        encrypted_image = image_array.copy().astype(np.int32)
+        # Shifting a byte by 8 or more bits gives the same result as 8, and larger
+        # amounts would not fit the uint8 operands below
+        shift_amount = min(shift_amount, 8)
         
         if direction == 'left':
-            encrypted_image = encrypted_image << shift_amount
+            def kernel(rows, out_rows):
+                # Values that would overflow past 255 saturate at 255: negating the 0/1
+                # overflow bytes gives a 0x00/0xFF mask to OR in, which avoids a far
+                # slower boolean-indexed assignment
+                saturated = np.greater(rows, 255 >> shift_amount).view(np.uint8)
+                np.negative(saturated, out=saturated)
+                np.left_shift(rows, shift_amount, out=out_rows)
+                np.bitwise_or(out_rows, saturated, out=out_rows)
         elif direction == 'right':
-            encrypted_image = encrypted_image >> shift_amount
+            def kernel(rows, out_rows):
+                np.right_shift(rows, shift_amount, out=out_rows)
         else:
             raise ValueError(f"Unsupported direction: {direction}")
         
-        # Ensure values stay in valid range [0, 255]
-        encrypted_image = np.clip(encrypted_image, 0, 255).astype(np.uint8)
-        
-        return encrypted_image
+        if out is None:
+            out = np.empty_like(image_array)
+        _map_row_bands(kernel, image_array, out)
+        return out
     
-    def color_channel_shift(self, image_array: np.ndarray) -> np.ndarray:
+    def color_channel_shift(self, image_array: np.ndarray, inverse: bool = False) -> np.ndarray:
         """
         Shift color channels (RGB -> GBR -> BRG -> RGB).
         
         Args:
             image_array (np.ndarray): Input image array
+            inverse (bool): Shift the channels back (B->G, G->R, R->B)
             
         Returns:
             np.ndarray: Image with shifted color channels
         """
-        encrypted_image = image_array.copy()
+        # Shift channels: R->G, G->B, B->R, i.e. new (R, G, B) = old (B, R, G)
+        channel_order = (1, 2, 0) if inverse else (2, 0, 1)
         
-        # Shift channels: R->G, G->B, B->R
-        temp = encrypted_image[:, :, 0].copy()  # Save R channel
-        encrypted_image[:, :, 0] = encrypted_image[:, :, 2]  # R = B
-        encrypted_image[:, :, 2] = encrypted_image[:, :, 1]  # B = G
-        encrypted_image[:, :, 1] = temp  # G = original R
+        # Copy each source channel straight to its destination; no full copy or temporaries
+        encrypted_image = np.empty_like(image_array)
+        for target, source in enumerate(channel_order):
+            encrypted_image[:, :, target] = image_array[:, :, source]
+        # Channels beyond RGB (e.g. alpha) are not shifted
+        encrypted_image[:, :, 3:] = image_array[:, :, 3:]
         
         return encrypted_image
     
@@ -295,6 +645,63 @@ class ImageEncryptor:
     # HIGH-LEVEL ENCRYPT/DECRYPT METHODS
     # =========================
     
+    def encrypt_array(self, image_array: np.ndarray, method: str = 'xor', inplace: bool = False,
+                      **kwargs) -> np.ndarray:
+        """
+        Encrypt an image array using the specified method.
+        
+        Args:
+            image_array (np.ndarray): Input image array
+            method (str): Encryption method ('xor', 'arithmetic', 'bit_shift', 
+                         'adjacent_swap', 'random_swap', 'block_swap', 'channel_shift')
+            inplace (bool): Overwrite image_array (must be writable uint8) for the
+                pixel-wise methods instead of allocating a new array
+            **kwargs: Additional arguments for specific methods
+            
+        Returns:
+            np.ndarray: Encrypted image array
+        """
+        try:
+            method_name, defaults = _ENCRYPT_OPS[method]
+        except KeyError:
+            raise ValueError(f"Unsupported encryption method: {method}") from None
+        
+        # Look up only the arguments this method takes, falling back to its defaults
+        params = {name: kwargs.get(name, default) for name, default in defaults.items()}
+        if inplace and method in _IN_PLACE_METHODS:
+            params['out'] = image_array
+        
+        return getattr(self, method_name)(image_array, **params)
+    
+    def decrypt_array(self, encrypted_array: np.ndarray, method: str = 'xor', inplace: bool = False,
+                      **kwargs) -> np.ndarray:
+        """
+        Decrypt an image array (for reversible methods).
+        
+        Args:
+            encrypted_array (np.ndarray): Encrypted image array
+            method (str): Decryption method (must match encryption method)
+            inplace (bool): Overwrite encrypted_array (must be writable uint8) for the
+                pixel-wise methods instead of allocating a new array
+            **kwargs: Additional arguments for specific methods
+            
+        Returns:
+            np.ndarray: Decrypted image array
+        """
+        if method not in _DECRYPT_PARAMS:
+            raise ValueError(f"Unsupported decryption method: {method}")
+        if method in _SEEDED_METHODS and self.seed is None:
+            print(f"Warning: Method '{method}' may not be easily reversible without the exact same random seed.")
+            print("Attempting decryption with same parameters...")
+        
+        # Decrypt by calling the encryption method with arguments that undo it
+        method_name, defaults = _ENCRYPT_OPS[method]
+        params = _DECRYPT_PARAMS[method]({name: kwargs.get(name, default) for name, default in defaults.items()})
+        if inplace and method in _IN_PLACE_METHODS:
+            params['out'] = encrypted_array
+        
+        return getattr(self, method_name)(encrypted_array, **params)
+    
     def encrypt_image(self, image_path: str, output_path: str, method: str = 'xor', **kwargs) -> None:
         """
         Encrypt an image using the specified method.
@@ -306,33 +713,12 @@ class ImageEncryptor:
                          'adjacent_swap', 'random_swap', 'block_swap', 'channel_shift')
             **kwargs: Additional arguments for specific methods
         """
-        # Load image
-        image_array = self.load_image(image_path)
-        
-        # Apply encryption based on method
-        if method == 'xor':
-            key = kwargs.get('key', 123)
-            encrypted_image = self.xor_encrypt(image_array, key)
-        elif method == 'arithmetic':
-            operation = kwargs.get('operation', 'add')
-            value = kwargs.get('value', 50)
-            encrypted_image = self.arithmetic_encrypt(image_array, operation, value)
-        elif method == 'bit_shift':
-            shift_amount = kwargs.get('shift_amount', 2)
-            direction = kwargs.get('direction', 'left')
-            encrypted_image = self.bit_shift_encrypt(image_array, shift_amount, direction)
-        elif method == 'adjacent_swap':
-            encrypted_image = self.swap_adjacent_pixels(image_array)
-        elif method == 'random_swap':
-            swap_percentage = kwargs.get('swap_percentage', 0.5)
-            encrypted_image = self.swap_random_pixels(image_array, swap_percentage)
-        elif method == 'block_swap':
-            block_size = kwargs.get('block_size', 2)
-            encrypted_image = self.swap_block_pixels(image_array, block_size)
-        elif method == 'channel_shift':
-            encrypted_image = self.color_channel_shift(image_array)
-        else:
-            raise ValueError(f"Unsupported encryption method: {method}")
+        # Load image; a read-only buffer saves a copy, since encrypting out of place
+        # costs the same as copying and then encrypting in place
+        image_array = self.load_image(image_path, writeable=False)
+        
+        # Apply encryption, reusing the freshly loaded buffer when it is writable
+        encrypted_image = self.encrypt_array(image_array, method, inplace=image_array.flags.writeable, **kwargs)
         
         # Save encrypted image
         self.save_image(encrypted_image, output_path)
@@ -348,56 +734,13 @@ class ImageEncryptor:
             method (str): Decryption method (must match encryption method)
             **kwargs: Additional arguments for specific methods
         """
-        # Load encrypted image
-        encrypted_array = self.load_image(encrypted_image_path)
-        
-        # Apply decryption based on method
-        if method == 'xor':
-            # XOR is its own inverse
-            key = kwargs.get('key', 123)
-            decrypted_image = self.xor_encrypt(encrypted_array, key)
-        elif method == 'arithmetic':
-            # Reverse the arithmetic operation
-            operation = kwargs.get('operation', 'add')
-            value = kwargs.get('value', 50)
-            
-            if operation == 'add':
-                decrypted_image = self.arithmetic_encrypt(encrypted_array, 'subtract', value)
-            elif operation == 'subtract':
-                decrypted_image = self.arithmetic_encrypt(encrypted_array, 'add', value)
-            elif operation == 'multiply' and value != 0:
-                decrypted_image = self.arithmetic_encrypt(encrypted_array, 'divide', value)
-            elif operation == 'divide':
-                decrypted_image = self.arithmetic_encrypt(encrypted_array, 'multiply', value)
-            else:
-                raise ValueError(f"Cannot reverse operation: {operation}")
-        elif method == 'bit_shift':
-            # Reverse the bit shift
-            shift_amount = kwargs.get('shift_amount', 2)
-            direction = kwargs.get('direction', 'left')
-            
-            reverse_direction = 'right' if direction == 'left' else 'left'
-            decrypted_image = self.bit_shift_encrypt(encrypted_array, shift_amount, reverse_direction)
-        elif method == 'adjacent_swap':
-            # Adjacent swap is its own inverse
-            decrypted_image = self.swap_adjacent_pixels(encrypted_array)
-        elif method == 'channel_shift':
-            # Apply channel shift twice more to complete the cycle (3 total shifts = back to original)
-            temp_image = self.color_channel_shift(encrypted_array)
-            decrypted_image = self.color_channel_shift(temp_image)
-        else:
-            print(f"Warning: Method '{method}' may not be easily reversible without the exact same random seed.")
-            print("Attempting decryption with same parameters...")
-            
-            if method == 'random_swap':
-                swap_percentage = kwargs.get('swap_percentage', 0.5)
-                decrypted_image = self.swap_random_pixels(encrypted_array, swap_percentage)
-            elif method == 'block_swap':
-                block_size = kwargs.get('block_size', 2)
-                decrypted_image = self.swap_block_pixels(encrypted_array, block_size)
-            else:
-                raise ValueError(f"Unsupported decryption method: {method}")
+        # Load encrypted image; read-only is fine, as in encrypt_image
+        encrypted_array = self.load_image(encrypted_image_path, writeable=False)
+        
+        # Apply decryption, reusing the freshly loaded buffer when it is writable
+        decrypted_image = self.decrypt_array(encrypted_array, method, inplace=encrypted_array.flags.writeable,
+                                             **kwargs)
         
         # Save decrypted image
         self.save_image(decrypted_image, output_path)
-        print(f"Image decrypted using '{method}' method and saved to: {output_path}")
\ No newline at end of file
+        print(f"Image decrypted using '{method}' method and saved to: {output_path}")